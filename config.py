@@ -8,7 +8,9 @@ import os
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
-load_dotenv()
+# (production gets real env vars, so skip the file read + parse there)
+if os.getenv("ENVIRONMENT", "development") != "production":
+    load_dotenv()
 
 
 class Config:
@@ -36,8 +38,8 @@ class Config:
     MAX_RESULT_ROWS = 10
     QUERY_TIMEOUT = 30
     CACHE_TTL = 3600
-    DB_POOL_MIN = 1
-    DB_POOL_MAX = 10
+    DB_POOL_MIN = 1   # opened when the pool is created
+    DB_POOL_MAX = 10  # opened by prewarm() at startup and kept idle
 
     @classmethod
     def validate(cls):
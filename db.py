@@ -17,15 +17,98 @@ This is critical for production performance.
 """
 
 import logging
+import re
+import threading
+from cachetools import TTLCache
 import psycopg2
 from psycopg2 import pool
 from typing import Tuple, List
 from config import config
 from error_handlers import DatabaseError, ValidationError
-import sqlparse
 
 logger = logging.getLogger(__name__)
 
+# Hot-path settings bound once at import
+_MAX_ROWS = config.MAX_RESULT_ROWS
+_TIMEOUT_MS = config.QUERY_TIMEOUT * 1000
+
+# Write/DDL keywords we never allow (\b keeps columns like updated_at valid)
+_DANGEROUS_RE = re.compile(
+    r"\b(?:DROP|DELETE|UPDATE|INSERT|ALTER|TRUNCATE|GRANT|REVOKE|COPY)\b",
+    re.IGNORECASE
+)
+
+# Quoted literals/identifiers come first so comment markers
+# inside them ('North--East', '%/*%') are left alone
+_QUOTED = r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\""
+_QUOTED_RE = re.compile(_QUOTED)
+_COMMENTS_RE = re.compile(_QUOTED + r"|/\*.*?\*/|--[^\n]*", re.DOTALL)
+
+# First keyword must start a read query (WITH covers CTEs)
+_SELECT_RE = re.compile(r"(?:SELECT|WITH)\b", re.IGNORECASE)
+
+
+def _keep_quoted(match: re.Match) -> str:
+    """Keep quoted text, replace a comment with a space"""
+    token = match.group(0)
+    return token if token[0] in "'\"" else " "
+
+
+def _strip_comments(sql: str) -> str:
+    """Remove SQL comments (outside quoted text) and surrounding whitespace"""
+    return _COMMENTS_RE.sub(_keep_quoted, sql).strip()
+
+
+class _ResettingConnectionPool(pool.ThreadedConnectionPool):
+    """
+    Thread-safe pool that resets session state on release
+
+    Works like PgBouncer's transaction mode: every connection comes
+    back clean (DISCARD ALL drops SET values, temp tables, prepared
+    plans and cursors), so server-side memory stays bounded.
+    """
+
+    def getconn(self, key=None):
+        conn = super().getconn(key)
+
+        # Read-only SELECTs need no COMMIT round trip
+        # (DISCARD ALL also refuses to run inside a transaction)
+        conn.autocommit = True
+        return conn
+
+    def putconn(self, conn=None, key=None, close=False):
+        # Only reset connections the pool will keep; beyond minconn
+        # (or once closed) psycopg2 closes them right after this
+        with self._lock:
+            kept = not self.closed and len(self._pool) < self.minconn
+
+        if kept and conn is not None and not close and not conn.closed:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("DISCARD ALL")
+            except psycopg2.Error as e:
+                logger.warning(f"Session reset failed, dropping connection: {str(e)}")
+                close = True
+
+        super().putconn(conn, key, close)
+
+    def fill(self) -> int:
+        """
+        Open idle connections up to maxconn without checking them out
+
+        getconn raises PoolError instead of waiting when every
+        connection is in use, so warming must never hold them.
+        """
+        opened = 0
+
+        while True:
+            with self._lock:
+                if self.closed or len(self._pool) + len(self._used) >= self.maxconn:
+                    return opened
+                self._connect()
+
+            opened += 1
+
 
 class DatabaseExecutor:
     """
@@ -37,11 +120,19 @@ class DatabaseExecutor:
         try:
             logger.info("Initializing database connection pool...")
 
-            self.conn_pool = psycopg2.pool.SimpleConnectionPool(
+            # Threaded pool: slash commands are processed concurrently,
+            # and SimpleConnectionPool is not safe to share across threads
+            self.conn_pool = _ResettingConnectionPool(
                 config.DB_POOL_MIN,
                 config.DB_POOL_MAX,
                 config.DATABASE_URL,
-                connect_timeout=10
+                connect_timeout=10,
+                # Applied once per connection instead of a SET per query
+                options=(
+                    f"-c statement_timeout={_TIMEOUT_MS} "
+                    "-c default_transaction_read_only=on "
+                    "-c idle_in_transaction_session_timeout=30000"
+                )
             )
 
             logger.info(
@@ -49,6 +140,10 @@ class DatabaseExecutor:
                 f"({config.DB_POOL_MIN}-{config.DB_POOL_MAX} connections)"
             )
 
+            # Results per SQL text (same question -> same SQL -> same rows)
+            self._cache = TTLCache(maxsize=256, ttl=config.CACHE_TTL)
+            self._cache_lock = threading.Lock()
+
         except Exception as e:
             logger.error(f"Database pool creation failed: {str(e)}")
             raise DatabaseError(
@@ -58,24 +153,45 @@ class DatabaseExecutor:
 
     # ------------------------------------------------------------------
 
+    def prewarm(self):
+        """
+        Open idle connections up to DB_POOL_MAX ahead of traffic
+
+        psycopg2 pools only keep `minconn` idle connections and close
+        the rest on putconn, so from here on the pool keeps up to
+        DB_POOL_MAX (DB_POOL_MIN only sizes the pool at creation).
+        """
+        self.conn_pool.minconn = config.DB_POOL_MAX
+
+        try:
+            opened = self.conn_pool.fill()
+
+        except Exception as e:
+            logger.warning(f"Database pool pre-warm stopped early: {str(e)}")
+            return
+
+        logger.info(f"Database pool pre-warmed ({opened} new connections)")
+
+    # ------------------------------------------------------------------
+
     def _is_safe_query(self, sql: str) -> bool:
         """
         Validate SQL is safe (SELECT only)
         """
         try:
-            parsed = sqlparse.parse(sql)
-            if not parsed:
-                return False
+            cleaned = _strip_comments(sql)
 
-            statement = parsed[0]
-            stmt_type = statement.get_type().upper()
+            if not _SELECT_RE.match(cleaned):
+                logger.warning(f"Rejected non-SELECT: {cleaned[:20]}")
+                return False
 
-            if stmt_type != "SELECT":
-                logger.warning(f"Rejected non-SELECT: {stmt_type}")
+            # ';' inside a literal ('a;b') is not a statement separator
+            unquoted = _QUOTED_RE.sub("''", cleaned)
+            if ";" in unquoted.rstrip(";"):
+                logger.warning("Rejected multiple statements")
                 return False
 
-            dangerous = ["DROP", "DELETE", "UPDATE", "INSERT", "ALTER", "TRUNCATE"]
-            if any(keyword in sql.upper() for keyword in dangerous):
+            if _DANGEROUS_RE.search(sql):
                 logger.warning("Rejected query with dangerous keyword")
                 return False
 
@@ -87,10 +203,48 @@ class DatabaseExecutor:
 
     # ------------------------------------------------------------------
 
+    def _apply_row_limit(self, sql: str) -> str:
+        """
+        Push the row limit into the query plan.
+
+        Fetches MAX_RESULT_ROWS + 1 rows so we can still tell
+        the user when a result was truncated.
+        """
+        body = _strip_comments(sql).rstrip(";")
+        return f"SELECT * FROM ({body}) _t LIMIT {_MAX_ROWS + 1}"
+
+    # ------------------------------------------------------------------
+
     def execute_query(self, sql: str) -> Tuple[List[str], List[tuple], str]:
         """
         Execute SQL safely using pooled connection
         """
+        return self._run_query(sql, format_rows=False)
+
+    def execute_and_format(self, sql: str) -> Tuple[List[str], List[str], str]:
+        """
+        Execute SQL and format rows for Slack in the same call
+
+        Rows come back as " | " joined lines, so the caller
+        doesn't walk the result a second time.
+        """
+        return self._run_query(sql, format_rows=True)
+
+    # ------------------------------------------------------------------
+
+    def _run_query(self, sql: str, format_rows: bool) -> Tuple[List[str], list, str]:
+        """
+        Validate, execute and fetch up to MAX_RESULT_ROWS rows
+        """
+
+        cache_key = (sql.strip().rstrip(";"), format_rows)
+
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+
+        if cached is not None:
+            logger.info("Query result served from cache")
+            return cached
 
         if not self._is_safe_query(sql):
             raise ValidationError(
@@ -105,41 +259,41 @@ class DatabaseExecutor:
 
             # Get connection from pool
             conn = self.conn_pool.getconn()
+
             cursor = conn.cursor()
 
-            # Set timeout (milliseconds)
-            cursor.execute(
-                f"SET statement_timeout = {config.QUERY_TIMEOUT * 1000}"
-            )
+            # Execute query (timeout + read-only set on the connection,
+            # LIMIT in the SQL bounds what the server sends back)
+            cursor.execute(self._apply_row_limit(sql))
 
-            # Execute query
-            cursor.execute(sql)
+            # Only pull what we display (+1 to detect truncation)
+            rows = cursor.fetchmany(_MAX_ROWS + 1)
+            truncated = len(rows) > _MAX_ROWS
+            rows = rows[:_MAX_ROWS]
 
-            rows = cursor.fetchall()
-            columns = (
-                [desc[0] for desc in cursor.description]
-                if cursor.description else []
-            )
+            # Format here so callers don't walk the rows again
+            if format_rows:
+                rows = [" | ".join(map(str, row)) for row in rows]
+
+            # _is_safe_query guarantees a SELECT, so description is set
+            columns = [desc.name for desc in cursor.description]
 
             cursor.close()
-            conn.commit()
 
             row_count = len(rows)
 
-            if row_count == 0:
-                query_info = "0 rows"
+            if truncated:
+                query_info = f"first {row_count} rows (limited)"
             elif row_count == 1:
                 query_info = "1 row"
-            elif row_count <= config.MAX_RESULT_ROWS:
-                query_info = f"{row_count} rows"
             else:
-                rows = rows[:config.MAX_RESULT_ROWS]
-                query_info = (
-                    f"{config.MAX_RESULT_ROWS} of {row_count} rows (limited)"
-                )
+                query_info = f"{row_count} rows"
 
             logger.info(f"Query executed successfully: {query_info}")
 
+            with self._cache_lock:
+                self._cache[cache_key] = (columns, rows, query_info)
+
             return columns, rows, query_info
 
         except ValidationError:
@@ -179,6 +333,14 @@ class DatabaseExecutor:
 
     # ------------------------------------------------------------------
 
+    def clear_cache(self):
+        """Drop all cached query results"""
+        with self._cache_lock:
+            self._cache.clear()
+        logger.info("Query result cache cleared")
+
+    # ------------------------------------------------------------------
+
     def close(self):
         """Close all connections in pool"""
         if hasattr(self, "conn_pool"):
@@ -186,5 +348,22 @@ class DatabaseExecutor:
             logger.info("Database connections closed")
 
 
-# Global instance (initialized once at startup)
-db_executor = DatabaseExecutor()
\ No newline at end of file
+# Shared instance, created on first use (see get_db_executor)
+_db_executor = None
+_db_executor_lock = threading.Lock()
+
+
+def get_db_executor() -> DatabaseExecutor:
+    """Return the shared executor, opening the pool on first call"""
+    global _db_executor
+    if _db_executor is None:
+        with _db_executor_lock:
+            if _db_executor is None:
+                _db_executor = DatabaseExecutor()
+    return _db_executor
+
+
+def close_db_executor():
+    """Close the shared executor's pool if it was ever opened"""
+    if _db_executor is not None:
+        _db_executor.close()
\ No newline at end of file
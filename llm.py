@@ -11,6 +11,8 @@ Assignment-compliant version:
 """
 
 import logging
+import threading
+from cachetools import TTLCache
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, SystemMessage
 from config import config
@@ -18,6 +20,10 @@ from error_handlers import SQLGenerationError
 
 logger = logging.getLogger(__name__)
 
+# LLM settings bound once at import
+_MODEL = config.GROQ_MODEL
+_API_KEY = config.GROQ_API_KEY
+
 
 class SQLChainExecutor:
     """
@@ -35,13 +41,17 @@ class SQLChainExecutor:
             logger.info("Initializing SQL generator...")
 
             self.llm = ChatGroq(
-                model=config.GROQ_MODEL,
+                model=_MODEL,
                 temperature=0,
-                api_key=config.GROQ_API_KEY,
+                api_key=_API_KEY,
                 timeout=20
             )
 
-            logger.info(f"LLM initialized: {config.GROQ_MODEL}")
+            logger.info(f"LLM initialized: {_MODEL}")
+
+            # Generated SQL per normalized question (skips repeat LLM calls)
+            self._cache = TTLCache(maxsize=512, ttl=config.CACHE_TTL)
+            self._cache_lock = threading.Lock()
 
             # Minimal schema prompt (assignment compliant)
             self.system_prompt = """
@@ -66,6 +76,10 @@ Rules:
 - Only return SQL.
 """
 
+            # Built once and always sent first: the stable prefix lets
+            # provider-side prompt caching reuse it across questions
+            self._system_msg = SystemMessage(content=self.system_prompt)
+
         except Exception as e:
             logger.error(f"LLM initialization failed: {str(e)}")
             raise SQLGenerationError(
@@ -83,11 +97,24 @@ Rules:
             "success": True
         }
         """
+        # Whitespace only - case matters inside SQL string literals
+        cache_key = " ".join(question.split())
+
+        with self._cache_lock:
+            cached_sql = self._cache.get(cache_key)
+
+        if cached_sql is not None:
+            logger.info("SQL served from cache")
+            return {
+                "result": cached_sql,
+                "success": True
+            }
+
         try:
             logger.info(f"Generating SQL for: {question}")
 
             messages = [
-                SystemMessage(content=self.system_prompt),
+                self._system_msg,
                 HumanMessage(content=question)
             ]
 
@@ -99,6 +126,9 @@ Rules:
             if not sql.endswith(";"):
                 sql += ";"
 
+            with self._cache_lock:
+                self._cache[cache_key] = sql
+
             logger.info("SQL generated successfully")
 
             return {
@@ -114,5 +144,16 @@ Rules:
             )
 
 
-# Global instance (used by main.py)
-sql_chain = SQLChainExecutor()
\ No newline at end of file
+# Shared instance, created on first use (see get_sql_chain)
+_sql_chain = None
+_sql_chain_lock = threading.Lock()
+
+
+def get_sql_chain() -> SQLChainExecutor:
+    """Return the shared SQL generator, creating it on first call"""
+    global _sql_chain
+    if _sql_chain is None:
+        with _sql_chain_lock:
+            if _sql_chain is None:
+                _sql_chain = SQLChainExecutor()
+    return _sql_chain
\ No newline at end of file
@@ -5,15 +5,19 @@ Handles Slack slash commands and coordinates:
 Slack → LangChain → PostgreSQL → Slack
 """
 
+import asyncio
 import logging
+import logging.handlers
+import queue
+from urllib.parse import parse_qsl
 from fastapi import FastAPI, Request, HTTPException, BackgroundTasks
-from slack_sdk.signature import SignatureVerifier
+from fastapi.responses import ORJSONResponse
 
 from config import config
-from llm import sql_chain
-from db import db_executor
+from llm import get_sql_chain
+from db import get_db_executor, close_db_executor
 from slack_handler import slack_handler
-from utils import format_error_message, log_event
+from utils import SlackSignatureVerifier, format_error_message, log_event
 from error_handlers import BotError, ErrorHandler
 
 
@@ -21,13 +25,20 @@ from error_handlers import BotError, ErrorHandler
 # LOGGING SETUP
 # ============================================================
 
+# Handlers write from a background thread; request code only enqueues
+log_queue = queue.Queue(-1)
+
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.FileHandler("logs/app.log"),
+    logging.StreamHandler()
+)
+log_listener.start()
+
 logging.basicConfig(
     level=config.LOG_LEVEL,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("logs/app.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 
 logger = logging.getLogger(__name__)
@@ -40,10 +51,11 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Slack Data Bot",
     description="Natural language to SQL Slack bot",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-signature_verifier = SignatureVerifier(config.SLACK_SIGNING_SECRET)
+signature_verifier = SlackSignatureVerifier(config.SLACK_SIGNING_SECRET)
 
 
 # ============================================================
@@ -82,10 +94,15 @@ async def handle_slash_command(request: Request, background_tasks: BackgroundTas
     # -------------------------------
     body = await request.body()
 
-    if not signature_verifier.is_valid_request(body, request.headers):
+    if not signature_verifier.is_valid(
+        body,
+        request.headers.get("X-Slack-Request-Timestamp"),
+        request.headers.get("X-Slack-Signature")
+    ):
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-    form_data = await request.form()
+    # Parse the form from the bytes we already hold (no second read)
+    form_data = dict(parse_qsl(body.decode("utf-8"), keep_blank_values=True))
 
     question = form_data.get("text", "").strip()
     response_url = form_data.get("response_url")
@@ -143,7 +160,11 @@ async def process_slash_command(question: str, response_url: str, user_id: str):
         # ---------------------------------------
         # 1️⃣ Generate SQL
         # ---------------------------------------
-        sql_result = sql_chain.execute(question)
+        # LLM and DB calls are blocking - run them in worker threads
+        # so the event loop keeps serving other Slack requests
+        sql_result = await asyncio.to_thread(
+            lambda: get_sql_chain().execute(question)
+        )
         sql_query = sql_result["result"]
 
         logger.info(f"Generated SQL: {sql_query}")
@@ -151,24 +172,22 @@ async def process_slash_command(question: str, response_url: str, user_id: str):
         # ---------------------------------------
         # 2️⃣ Execute SQL
         # ---------------------------------------
-        columns, rows, info = db_executor.execute_query(sql_query)
+        columns, lines, info = await asyncio.to_thread(
+            lambda: get_db_executor().execute_and_format(sql_query)
+        )
 
         # ---------------------------------------
         # 3️⃣ Format Result for Slack
         # ---------------------------------------
 
-        if not rows:
+        if not lines:
             message = "*Results:*\n\nNo data found."
         else:
-            # Format as simple table
+            # Format as simple table (rows already formatted by db)
             header = " | ".join(columns)
             separator = "-" * len(header)
 
-            formatted_rows = []
-            for row in rows:
-                formatted_rows.append(" | ".join(str(cell) for cell in row))
-
-            table = "\n".join(formatted_rows)
+            table = "\n".join(lines)
 
             message = f"*Results:*\n```{header}\n{separator}\n{table}```\n_{info}_"
 
@@ -201,15 +220,47 @@ async def process_slash_command(question: str, response_url: str, user_id: str):
 # STARTUP & SHUTDOWN
 # ============================================================
 
+# Background warm-up tasks (referenced so they aren't garbage-collected)
+startup_tasks = set()
+
+
+def _on_startup_task_done(task: asyncio.Task):
+    """Log warm-up failures instead of losing them"""
+    startup_tasks.discard(task)
+
+    if task.cancelled():
+        return
+
+    error = task.exception()
+    if error:
+        logger.error(
+            f"Startup warm-up failed: {str(error)}",
+            exc_info=(type(error), error, error.__traceback__)
+        )
+
+
 @app.on_event("startup")
 async def startup():
     logger.info("Slack Data Bot starting...")
 
+    # Build LLM client and warm the DB pool in the background so
+    # /health answers immediately
+    for task in (
+        asyncio.create_task(asyncio.to_thread(get_sql_chain)),
+        asyncio.create_task(
+            asyncio.to_thread(lambda: get_db_executor().prewarm())
+        ),
+    ):
+        startup_tasks.add(task)
+        task.add_done_callback(_on_startup_task_done)
+
 
 @app.on_event("shutdown")
 async def shutdown():
-    db_executor.close()
+    close_db_executor()
+    await slack_handler.close()
     logger.info("Application shutdown complete.")
+    log_listener.stop()
 
 
 # ============================================================
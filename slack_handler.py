@@ -2,6 +2,7 @@
 
 import logging
 import httpx
+import orjson
 from slack_sdk import WebClient
 from config import config
 from error_handlers import SlackError
@@ -14,6 +15,14 @@ class SlackHandler:
 
     def __init__(self):
         self.client = WebClient(token=config.SLACK_BOT_TOKEN)
+
+        # Shared HTTP client so response_url posts reuse keep-alive connections
+        self._client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            http2=True
+        )
+
         logger.info("Slack client initialized")
 
     async def send_response(self, response_url: str, text: str) -> bool:
@@ -26,8 +35,11 @@ class SlackHandler:
                 "mrkdwn": True
             }
 
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.post(response_url, json=payload)
+            response = await self._client.post(
+                response_url,
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"}
+            )
 
             if response.status_code != 200:
                 raise SlackError(
@@ -48,5 +60,10 @@ class SlackHandler:
                 user_friendly="Failed to send response to Slack"
             )
 
+    async def close(self):
+        """Close the shared HTTP client"""
+        await self._client.aclose()
+        logger.info("Slack HTTP client closed")
+
 
 slack_handler = SlackHandler()
\ No newline at end of file
@@ -3,7 +3,9 @@
 Test database executor with pooling
 """
 
-from db import db_executor
+from db import get_db_executor
+
+db_executor = get_db_executor()
 
 # Test queries
 test_queries = [
@@ -3,7 +3,9 @@
 Test if LangChain SQL integration works
 """
 
-from llm import sql_chain
+from llm import get_sql_chain
+
+sql_chain = get_sql_chain()
 
 # Test questions
 questions = [
@@ -0,0 +1,86 @@
+# test_slack_signature.py
+"""
+Tests for Slack request signature verification in utils.py
+Run with: pytest test_slack_signature.py
+"""
+
+import hashlib
+import hmac
+import time
+
+import pytest
+
+from utils import SlackSignatureVerifier
+
+SECRET = "8f742231b10e8888abcd99yyyzzz85a5"
+BODY = b"token=abc&command=%2Fask-data&text=revenue+by+region"
+
+
+def sign(body: bytes, timestamp: str, secret: str = SECRET) -> str:
+    """Signature as Slack computes it"""
+    basestring = f"v0:{timestamp}:".encode() + body
+    return "v0=" + hmac.new(secret.encode(), basestring, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture
+def verifier():
+    return SlackSignatureVerifier(SECRET)
+
+
+@pytest.fixture
+def now():
+    return str(int(time.time()))
+
+
+def test_valid_signature(verifier, now):
+    assert verifier.is_valid(BODY, now, sign(BODY, now))
+
+
+def test_verifier_is_reusable(verifier, now):
+    other = b"text=orders"
+    assert verifier.is_valid(BODY, now, sign(BODY, now))
+    assert verifier.is_valid(other, now, sign(other, now))
+
+
+def test_tampered_body(verifier, now):
+    assert not verifier.is_valid(BODY + b"x", now, sign(BODY, now))
+
+
+def test_wrong_secret(verifier, now):
+    assert not verifier.is_valid(BODY, now, sign(BODY, now, secret="other"))
+
+
+def test_stale_timestamp(verifier):
+    stale = str(int(time.time()) - 60 * 5 - 10)
+    assert not verifier.is_valid(BODY, stale, sign(BODY, stale))
+
+
+def test_future_timestamp(verifier):
+    future = str(int(time.time()) + 60 * 5 + 10)
+    assert not verifier.is_valid(BODY, future, sign(BODY, future))
+
+
+def test_non_numeric_timestamp(verifier):
+    assert not verifier.is_valid(BODY, "yesterday", sign(BODY, "yesterday"))
+
+
+def test_oversized_timestamp(verifier):
+    huge = "9" * 400
+    assert not verifier.is_valid(BODY, huge, sign(BODY, huge))
+
+
+def test_non_ascii_signature(verifier, now):
+    assert not verifier.is_valid(BODY, now, "v0=\u00e9")
+
+
+@pytest.mark.parametrize("timestamp, signature", [
+    (None, "v0=abc"),
+    ("", "v0=abc"),
+    ("1700000000", None),
+    ("1700000000", ""),
+    (None, None),
+    ("9" * 400, None),
+    (None, "v0=\u00e9"),
+])
+def test_missing_headers(verifier, timestamp, signature):
+    assert not verifier.is_valid(BODY, timestamp, signature)
@@ -0,0 +1,73 @@
+# test_sql_safety.py
+"""
+Tests for the SELECT-only gate and row-limit wrapping in db.py
+Run with: pytest test_sql_safety.py
+"""
+
+import os
+
+# config validates on import - give it dummy values
+for key in ("SLACK_BOT_TOKEN", "SLACK_SIGNING_SECRET", "GROQ_API_KEY"):
+    os.environ.setdefault(key, "test")
+
+import pytest
+
+from db import DatabaseExecutor, _MAX_ROWS
+
+
+@pytest.fixture
+def executor():
+    # Skip __init__ so no connection pool is opened
+    return DatabaseExecutor.__new__(DatabaseExecutor)
+
+
+@pytest.mark.parametrize("sql", [
+    "SELECT * FROM sales_daily;",
+    "select region, sum(revenue) from sales_daily group by region",
+    "-- leading comment\nSELECT 1;",
+    "/* block */ SELECT 1;",
+    "WITH r AS (SELECT region FROM sales_daily) SELECT * FROM r;",
+    "SELECT created_at, region FROM sales_daily ORDER BY created_at;",
+    "SELECT 'a;b';",
+    "SELECT * FROM sales_daily WHERE region = 'North--East';",
+    "SELECT * FROM sales_daily WHERE region LIKE '%/*%' AND category = '*/';",
+])
+def test_allows_select(executor, sql):
+    assert executor._is_safe_query(sql)
+
+
+@pytest.mark.parametrize("sql", [
+    "",
+    "DROP TABLE sales_daily;",
+    "INSERT INTO sales_daily VALUES (1);",
+    "/* SELECT */ DELETE FROM sales_daily;",
+    "-- SELECT\nUPDATE sales_daily SET orders = 0;",
+    "SELECT 1; DROP TABLE sales_daily;",
+    "SELECT 'x'; SELECT 2;",
+    "SELECTED 1;",
+    "WITH d AS (DELETE FROM sales_daily RETURNING *) SELECT * FROM d;",
+])
+def test_rejects_non_select(executor, sql):
+    assert not executor._is_safe_query(sql)
+
+
+def test_row_limit_keeps_comment_markers_in_literals(executor):
+    sql = "SELECT * FROM sales_daily WHERE region = 'North--East';"
+    assert executor._apply_row_limit(sql) == (
+        "SELECT * FROM (SELECT * FROM sales_daily WHERE region = 'North--East')"
+        f" _t LIMIT {_MAX_ROWS + 1}"
+    )
+
+
+def test_row_limit_keeps_block_markers_in_literals(executor):
+    sql = "SELECT * FROM sales_daily WHERE region LIKE '%/*%' AND category = '*/'"
+    assert executor._apply_row_limit(sql) == (
+        f"SELECT * FROM ({sql}) _t LIMIT {_MAX_ROWS + 1}"
+    )
+
+
+def test_row_limit_strips_trailing_comment(executor):
+    sql = "SELECT region FROM sales_daily -- all regions\n;"
+    wrapped = executor._apply_row_limit(sql)
+    assert "--" not in wrapped
+    assert wrapped.endswith(f") _t LIMIT {_MAX_ROWS + 1}")